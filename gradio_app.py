@@ -1,13 +1,15 @@
 """Gradio web interface for conversational research and validation with checkpoint persistence."""
 
 import asyncio
-from collections.abc import AsyncGenerator, Generator
-from concurrent.futures import ThreadPoolExecutor
+import sqlite3
+from collections.abc import AsyncGenerator
 from io import BytesIO
 from pathlib import Path
 from typing import Any
 
+import aiosqlite
 import gradio as gr
+from gradio import processing_utils
 from langchain_core.runnables import RunnableConfig
 from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
 from tinytag import TinyTag
@@ -20,41 +22,25 @@ from src.langgraph_audio_agents.domain.interfaces.audio_service import AudioServ
 from src.langgraph_audio_agents.graph.research_validation_graph import (
     create_research_validation_graph,
 )
+from src.langgraph_audio_agents.infrastructure.audio.cached_tts import CachedAudioService
 from src.langgraph_audio_agents.infrastructure.audio.elevenlabs_tts import ElevenLabsTTS
 from src.langgraph_audio_agents.infrastructure.audio.google_tts import GoogleTTS
 from src.langgraph_audio_agents.infrastructure.audio.groq_tts import GroqTTS
 from src.langgraph_audio_agents.infrastructure.llm.openai_client import OpenAIClient
 from src.langgraph_audio_agents.infrastructure.search.tavily_search import TavilySearch
 from src.langgraph_audio_agents.utils.checkpoint_utils import (
+    configure_checkpoint_connection,
     list_all_thread_ids,
     list_topics_for_user,
     list_users,
     normalize_thread_id,
 )
 
-executor = ThreadPoolExecutor(max_workers=1)
-event_loop = None
-
-
-def get_event_loop():  # type: ignore[no-untyped-def]
-    """Get or create persistent event loop for async operations."""
-    global event_loop
-    if event_loop is None or event_loop.is_closed():
-        event_loop = asyncio.new_event_loop()
-
-        def run_loop():  # type: ignore[no-untyped-def]
-            asyncio.set_event_loop(event_loop)
-            event_loop.run_forever()
-
-        executor.submit(run_loop)
-    return event_loop
-
 
 class ConversationApp:
     def __init__(self) -> None:
         self.graph: Any = None
-        self.checkpointer: Any = None
-        self.checkpointer_context: Any = None
+        self.checkpointer: AsyncSqliteSaver | None = None
         self.db_path = Path(settings.checkpoint_db_path)
         self.audio_format = "mp3"
         self.researcher: ResearcherAgent | None = None
@@ -69,24 +55,31 @@ class ConversationApp:
         tavily = TavilySearch(settings.tavily)
 
         if settings.tts_provider == "groq":
-            researcher_tts: AudioService = GroqTTS(settings.groq)  # type: ignore[assignment]
-            validator_tts: AudioService = GroqTTS(settings.groq)  # type: ignore[assignment]
-            validator_tts.use_validator_voice()  # type: ignore[attr-defined]
-            self.audio_format = "wav"
+            groq_tts = GroqTTS(settings.groq)
+            researcher_tts: AudioService = groq_tts
+            validator_tts: AudioService = groq_tts.with_validator_voice()
+            self.audio_format = settings.groq.output_format
             status = "Using Groq TTS"
         elif settings.tts_provider == "google":
             researcher_tts = GoogleTTS(settings.google_tts)
-            validator_tts = GoogleTTS(settings.google_tts)
-            validator_tts.use_validator_voice()  # type: ignore[attr-defined]
+            validator_tts = researcher_tts.with_validator_voice()
+            # GoogleTTS always requests MP3 encoding, whatever output_format says
             self.audio_format = "mp3"
             status = "Using Google Cloud TTS"
         else:
             researcher_tts = ElevenLabsTTS(settings.elevenlabs)
-            validator_tts = ElevenLabsTTS(settings.elevenlabs)
-            validator_tts.use_validator_voice()  # type: ignore[attr-defined]
-            self.audio_format = "mp3"
+            validator_tts = researcher_tts.with_validator_voice()
+            # ElevenLabs formats look like mp3_44100_128: codec, sample rate, bitrate
+            self.audio_format = settings.elevenlabs.output_format.split("_", 1)[0]
             status = "Using ElevenLabs TTS"
 
+        researcher_tts = CachedAudioService(
+            researcher_tts, settings.tts_cache_path, max_disk_entries=settings.tts_cache_max_entries
+        )
+        validator_tts = CachedAudioService(
+            validator_tts, settings.tts_cache_path, max_disk_entries=settings.tts_cache_max_entries
+        )
+
         llm = OpenAIClient(settings.openai)
 
         self.researcher = ResearcherAgent(
@@ -103,25 +96,56 @@ class ConversationApp:
 
         workflow = create_research_validation_graph(self.researcher, self.validator)
 
-        self.checkpointer_context = AsyncSqliteSaver.from_conn_string(str(self.db_path))
-        self.checkpointer = await self.checkpointer_context.__aenter__()
+        # Own the connection directly so it lives as long as the app, not a context block
+        conn = await aiosqlite.connect(str(self.db_path))
+        await configure_checkpoint_connection(conn)
+        self.checkpointer = AsyncSqliteSaver(conn)
         self.graph = workflow.compile(checkpointer=self.checkpointer)
         self.initialized = True
 
         return f"Services initialized. {status}"
 
+    async def _distinct_users(self) -> list[str]:
+        """Get unique user names straight from the checkpoint database."""
+        if self.checkpointer is None:
+            return list_users(await list_all_thread_ids(self.db_path))
+
+        try:
+            rows = await self.checkpointer.conn.execute_fetchall(
+                "SELECT DISTINCT substr(thread_id, 1, instr(thread_id, ':') - 1) AS user "
+                "FROM checkpoints WHERE instr(thread_id, ':') > 0 ORDER BY user"
+            )
+        except sqlite3.Error:
+            return []
+        return [row[0] for row in rows]
+
+    async def _distinct_topics(self, user: str) -> list[str]:
+        """Get unique topic names for a user (case-insensitive) from the checkpoint database."""
+        if self.checkpointer is None:
+            return list_topics_for_user(await list_all_thread_ids(self.db_path), user)
+
+        try:
+            rows = await self.checkpointer.conn.execute_fetchall(
+                "SELECT DISTINCT substr(thread_id, instr(thread_id, ':') + 1) AS topic "
+                "FROM checkpoints WHERE instr(thread_id, ':') > 0 "
+                "AND lower(substr(thread_id, 1, instr(thread_id, ':') - 1)) = lower(?) "
+                "ORDER BY topic",
+                (user,),
+            )
+        except sqlite3.Error:
+            return []
+        return [row[0] for row in rows]
+
     async def get_users(self) -> list[str]:
         """Get list of all users from checkpoint database."""
-        thread_ids = await list_all_thread_ids(self.db_path)
-        users = list_users(thread_ids)
+        users = await self._distinct_users()
         return ["[Create New User]"] + users
 
     async def get_topics(self, user: str) -> list[str]:
         """Get list of topics for a specific user."""
         if user == "[Create New User]" or not user:
             return ["[Create New Topic]"]
-        thread_ids = await list_all_thread_ids(self.db_path)
-        topics = list_topics_for_user(thread_ids, user)
+        topics = await self._distinct_topics(user)
         return ["[Create New Topic]"] + topics
 
     async def load_conversation_history(self, user: str, topic: str) -> list[list[str]]:
@@ -198,51 +222,49 @@ class ConversationApp:
             existing_messages = []
             existing_metadata = {}
 
-        messages_list = []
-        for msg in existing_messages:
-            if isinstance(msg, dict):
-                messages_list.append(msg)
-            else:
-                messages_list.append({"role": msg.role, "content": msg.content})
-
-        messages_list.append({"role": "user", "content": user_query})
-
+        # Checkpointed messages are already Message instances, so reuse them as-is and only
+        # pass the new turn as a dict (pydantic coerces it into the state's Message type)
         initial_state = ConversationState(
-            messages=messages_list,
+            messages=existing_messages + [{"role": "user", "content": user_query}],
             user_query=user_query,
             metadata=existing_metadata,
         )
 
         history.append([user_query, ""])  # Start with empty response
 
-        researcher_audio_path = None
-        validator_audio_path = None
         researcher_text = ""
         validator_text = ""
-        researcher_audio_data = None
+        researcher_audio_path: str | None = None
+        validator_audio_path: str | None = None
         researcher_duration = 0.0
 
         async for event in self.graph.astream(initial_state, config=config):  # type: ignore[arg-type,attr-defined]
             if "researcher" in event:
                 researcher_data = event["researcher"]
                 researcher_text = researcher_data["messages"][-1].content
-                if researcher_data.get("audio_data"):
-                    researcher_audio_data = researcher_data["audio_data"]
-                    researcher_audio_path = self._save_temp_audio(
-                        researcher_audio_data, "researcher"
-                    )
-                    researcher_duration = self._get_audio_duration(researcher_audio_data)
-                    partial_response = (
-                        f"**Researcher:**\n{researcher_text}\n\n**Validator:**\n_Processing..._"
-                    )
-                    history[-1][1] = partial_response
-                    yield (
-                        history,
-                        researcher_audio_path,
-                        None,
-                        "",
-                        "Researcher complete. Validating...",
-                    )
+                partial_response = (
+                    f"**Researcher:**\n{researcher_text}\n\n**Validator:**\n_Processing..._"
+                )
+                history[-1][1] = partial_response
+                yield (
+                    history,
+                    None,
+                    None,
+                    "",
+                    "Researcher text ready, synthesizing audio...",
+                )
+
+            if "researcher_tts" in event and event["researcher_tts"].get("audio_data"):
+                researcher_audio_data = event["researcher_tts"]["audio_data"]
+                researcher_audio_path = self._cache_audio(researcher_audio_data, "researcher")
+                researcher_duration = self._get_audio_duration(researcher_audio_data)
+                yield (
+                    history,
+                    researcher_audio_path,
+                    None,
+                    "",
+                    "Researcher complete. Validating...",
+                )
 
             if "validator" in event:
                 validator_data = event["validator"]
@@ -252,10 +274,10 @@ class ConversationApp:
                 status = "VALIDATED" if is_validated else "NOT VALIDATED"
                 validator_text = f"{validator_text}\n\nConfidence: {confidence}% - {status}"
 
-                if validator_data.get("audio_data"):
-                    validator_audio_path = self._save_temp_audio(
-                        validator_data["audio_data"], "validator"
-                    )
+            if "validator_tts" in event and event["validator_tts"].get("audio_data"):
+                validator_audio_path = self._cache_audio(
+                    event["validator_tts"]["audio_data"], "validator"
+                )
 
         response = f"**Researcher:**\n{researcher_text}\n\n**Validator:**\n{validator_text}"
         history[-1][1] = response
@@ -271,6 +293,16 @@ class ConversationApp:
             f"Conversation saved with thread_id: {thread_id}",
         )
 
+    def _cache_audio(self, audio_data: bytes, prefix: str) -> str:
+        """Write audio into Gradio's cache under a name with the provider's extension.
+
+        The cache directory is derived from the content hash, so repeated clips reuse
+        one file. The extension lets Gradio serve the clip inline with an audio MIME type.
+        """
+        return processing_utils.save_bytes_to_cache(
+            audio_data, f"{prefix}.{self.audio_format}", cache_dir=demo.GRADIO_CACHE
+        )
+
     def _get_audio_duration(self, audio_data: bytes) -> float:
         """Get duration of audio in seconds using tinytag."""
         try:
@@ -281,74 +313,52 @@ class ConversationApp:
             print(f"Error getting audio duration: {e}")
             return 10.0
 
-    def _save_temp_audio(self, audio_data: bytes, prefix: str) -> str:
-        """Save audio data to temporary file and return path."""
-        import tempfile
-
-        with tempfile.NamedTemporaryFile(
-            suffix=f".{self.audio_format}", delete=False, prefix=prefix
-        ) as temp_file:
-            temp_file.write(audio_data)
-            return temp_file.name
-
     async def cleanup(self) -> None:
         """Clean up async resources."""
-        if self.checkpointer_context:
-            await self.checkpointer_context.__aexit__(None, None, None)
+        if self.checkpointer:
+            await self.checkpointer.conn.close()
+            self.checkpointer = None
 
 
 app = ConversationApp()
 
 
-def run_async(coro):  # type: ignore[no-untyped-def]
-    """Run async coroutine in persistent event loop."""
-    loop = get_event_loop()
-    future = asyncio.run_coroutine_threadsafe(coro, loop)
-    return future.result()
-
-
-def sync_initialize() -> tuple[str, gr.Dropdown]:
+async def handle_initialize() -> tuple[str, gr.Dropdown]:
     """Initialize services and return status with user dropdown."""
-    status = run_async(app.initialize_services())
-    users = run_async(app.get_users())
+    status = await app.initialize_services()
+    users = await app.get_users()
     return status, gr.Dropdown(choices=users, value=users[0] if users else None)
 
 
-def sync_get_users() -> list[str]:
-    """Get list of users synchronously."""
-    return run_async(app.get_users())
+async def handle_get_users() -> list[str]:
+    """Get list of users."""
+    return await app.get_users()
 
 
-def sync_get_topics(user: str) -> tuple[gr.Dropdown, list[list[str]]]:
+async def handle_get_topics(user: str) -> tuple[gr.Dropdown, list[list[str]]]:
     """Get topics for user and return dropdown with empty chat history."""
-    topics = run_async(app.get_topics(user))
+    topics = await app.get_topics(user)
     return gr.Dropdown(choices=topics, value=topics[0] if topics else None), []
 
 
-def sync_load_history(user: str, topic: str) -> list[list[str]]:
-    """Load conversation history synchronously."""
-    return run_async(app.load_conversation_history(user, topic))
+async def handle_load_history(user: str, topic: str) -> list[list[str]]:
+    """Load conversation history."""
+    return await app.load_conversation_history(user, topic)
 
 
-def sync_process(
+async def handle_process(
     user: str,
     topic: str,
     new_user: str,
     new_topic: str,
     query: str,
     history: list[list[str]],
-) -> Generator[tuple[list[list[str]], str | None, str | None, str, str]]:
+) -> AsyncGenerator[tuple[list[list[str]], str | None, str | None, str, str]]:
     """Process conversation query and stream results."""
-    loop = get_event_loop()
-    async_gen = app.process_conversation_stream(user, topic, new_user, new_topic, query, history)
-
-    while True:
-        try:
-            future = asyncio.run_coroutine_threadsafe(async_gen.__anext__(), loop)
-            result = future.result()
-            yield result
-        except StopAsyncIteration:
-            break
+    async for result in app.process_conversation_stream(
+        user, topic, new_user, new_topic, query, history
+    ):
+        yield result
 
 
 with gr.Blocks(title="Research & Validation Conversation") as demo:
@@ -401,24 +411,24 @@ with gr.Blocks(title="Research & Validation Conversation") as demo:
     thread_info = gr.Textbox(label="Thread Info", interactive=False)
 
     init_btn.click(
-        fn=sync_initialize,
+        fn=handle_initialize,
         outputs=[status_text, user_dropdown],
     )
 
     user_dropdown.change(
-        fn=sync_get_topics,
+        fn=handle_get_topics,
         inputs=user_dropdown,
         outputs=[topic_dropdown, chatbot],
     )
 
     load_btn.click(
-        fn=sync_load_history,
+        fn=handle_load_history,
         inputs=[user_dropdown, topic_dropdown],
         outputs=chatbot,
     )
 
     submit_btn.click(
-        fn=sync_process,
+        fn=handle_process,
         inputs=[
             user_dropdown,
             topic_dropdown,
@@ -431,7 +441,7 @@ with gr.Blocks(title="Research & Validation Conversation") as demo:
     )
 
     query_input.submit(
-        fn=sync_process,
+        fn=handle_process,
         inputs=[
             user_dropdown,
             topic_dropdown,
@@ -445,4 +455,6 @@ with gr.Blocks(title="Research & Validation Conversation") as demo:
 
 
 if __name__ == "__main__":
+    # uvicorn's default loop="auto" serves the app on uvloop when it is installed
+    # (a non-Windows dependency in pyproject.toml), so the async handlers run on it too
     demo.launch(server_name="0.0.0.0", server_port=7860, share=False)  # nosec B104
@@ -1,5 +1,8 @@
 """Researcher agent implementation."""
 
+import time
+from typing import Any
+
 from langgraph_audio_agents.domain.interfaces.agent import Agent
 from langgraph_audio_agents.domain.interfaces.audio_service import AudioService
 from langgraph_audio_agents.domain.interfaces.search_service import SearchService
@@ -25,6 +28,7 @@ class ResearcherAgent(Agent):
         search_service: SearchService,
         audio_service: AudioService,
         llm_client: OpenAIClient,
+        search_reuse_seconds: float = 300.0,
     ):
         """Initialize the researcher agent.
 
@@ -32,10 +36,12 @@ class ResearcherAgent(Agent):
             search_service: Service to perform searches (e.g., Tavily)
             audio_service: Service to generate audio from text (e.g., TTS)
             llm_client: LLM client for processing search results
+            search_reuse_seconds: How long search results for a repeated query are reused
         """
         self.search_service = search_service
         self.audio_service = audio_service
         self.llm_client = llm_client
+        self.search_reuse_seconds = search_reuse_seconds
 
     async def process(self, messages: list[Message]) -> AgentResponse:
         """Search for information and generate conversational audio response.
@@ -46,11 +52,44 @@ class ResearcherAgent(Agent):
         Returns:
             Research findings with text, audio summary, and generated audio
         """
+        response = await self.research(messages)
+        audio_data = await self.synthesize_audio(response.audio_summary)
+        return response.model_copy(update={"audio_data": audio_data})
+
+    async def research(
+        self, messages: list[Message], previous_metadata: dict[str, Any] | None = None
+    ) -> AgentResponse:
+        """Search for information and prepare the text responses, without audio.
+
+        Args:
+            messages: Conversation history
+            previous_metadata: Metadata of the previous research turn (optional). When it
+                holds results for the same query searched within search_reuse_seconds,
+                they are reused instead of searching again.
+
+        Returns:
+            Research findings with text and audio summary (audio_data is left empty)
+        """
         # Extract the user query from messages
         user_query = self._extract_user_query(messages)
 
+        # Re-asked questions still get a fresh synthesis (so validation can improve). Search
+        # results for the same query are reused only briefly (retries, double submits), so
+        # asking again later reaches the search service for fresh results.
+        search_results = ""
+        searched_at = time.time()
+        if previous_metadata and previous_metadata.get("query") == user_query:
+            previous_searched_at = previous_metadata.get("searched_at")
+            if (
+                previous_searched_at is not None
+                and searched_at - previous_searched_at < self.search_reuse_seconds
+            ):
+                search_results = previous_metadata.get("raw_results") or ""
+                searched_at = previous_searched_at
+
         # Perform search using Tavily
-        search_results = await self.search_service.search(user_query)
+        if not search_results:
+            search_results = await self.search_service.search(user_query)
 
         # Use LLM to synthesize search results into detailed text
         detailed_content = await self._synthesize_results(user_query, search_results, messages)
@@ -60,20 +99,28 @@ class ResearcherAgent(Agent):
             user_query, detailed_content, messages
         )
 
-        # Convert audio summary to speech
-        audio_data = await self.audio_service.synthesize(audio_summary_text)
-
         return AgentResponse(
             content=detailed_content,
             audio_summary=audio_summary_text,
-            audio_data=audio_data,
             metadata={
                 "agent": "researcher",
                 "query": user_query,
                 "raw_results": search_results,
+                "searched_at": searched_at,
             },
         )
 
+    async def synthesize_audio(self, audio_summary: str) -> bytes:
+        """Convert an audio summary to speech.
+
+        Args:
+            audio_summary: Conversational summary produced by research()
+
+        Returns:
+            Audio data as bytes
+        """
+        return await self.audio_service.synthesize(audio_summary)
+
     def _extract_user_query(self, messages: list[Message]) -> str:
         """Extract the user's question from message history.
 
@@ -168,7 +215,6 @@ class ResearcherAgent(Agent):
             LLM generated response
         """
         if self.llm_client:
-            combined_input = f"{system_prompt}\n\n{user_prompt}"
-            return await self.llm_client.create_response(input=combined_input)
+            return await self.llm_client.create_response(system_prompt, user_prompt)
 
         return f"Research results (unprocessed): {user_prompt}"
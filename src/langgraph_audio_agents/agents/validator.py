@@ -1,5 +1,6 @@
 """Validator agent implementation."""
 
+import logging
 from typing import Any
 
 from langgraph_audio_agents.domain.interfaces.agent import Agent
@@ -15,6 +16,8 @@ from langgraph_audio_agents.prompts.validator_prompts import (
     get_validator_audio_summary_user_prompt,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class ValidatorAgent(Agent):
     """Agent that validates research findings and produces conversational audio."""
@@ -50,6 +53,24 @@ class ValidatorAgent(Agent):
         Returns:
             Validation assessment with text, audio summary, and generated audio
         """
+        response = await self.validate(messages, previous_validations=previous_validations)
+        audio_data = await self.synthesize_audio(response.audio_summary)
+        return response.model_copy(update={"audio_data": audio_data})
+
+    async def validate(
+        self,
+        messages: list[Message],
+        previous_validations: list[dict[str, Any]] | None = None,
+    ) -> AgentResponse:
+        """Validate research findings and write the conversational summary.
+
+        Args:
+            messages: Conversation history including user query and research results
+            previous_validations: Previous validation results for improvement tracking
+
+        Returns:
+            Validation assessment with text and audio summary (audio_data is left empty)
+        """
         user_query = self._extract_user_query(messages)
         research_result = self._extract_research_result(messages)
 
@@ -64,12 +85,9 @@ class ValidatorAgent(Agent):
             user_query, detailed_validation, confidence_score, messages
         )
 
-        audio_data = await self.audio_service.synthesize(audio_summary_text)
-
         return AgentResponse(
             content=detailed_validation,
             audio_summary=audio_summary_text,
-            audio_data=audio_data,
             metadata={
                 "agent": "validator",
                 "query": user_query,
@@ -79,6 +97,17 @@ class ValidatorAgent(Agent):
             },
         )
 
+    async def synthesize_audio(self, audio_summary: str) -> bytes:
+        """Convert an audio summary to speech.
+
+        Args:
+            audio_summary: Conversational summary produced by validate()
+
+        Returns:
+            Audio data as bytes
+        """
+        return await self.audio_service.synthesize(audio_summary)
+
     def _extract_user_query(self, messages: list[Message]) -> str:
         """Extract the user's question from message history.
 
@@ -132,14 +161,15 @@ class ValidatorAgent(Agent):
             )
 
         # Debug logging
-        if previous_validations:
-            print(
-                f"\n[DEBUG] Validator received {len(previous_validations)} previous validation(s)"
-            )
-            for i, val in enumerate(previous_validations, 1):
-                print(f"  Previous {i}: Score {val.get('confidence_score', 'N/A')}%")
-        else:
-            print("\n[DEBUG] Validator received no previous validations")
+        if logger.isEnabledFor(logging.DEBUG):
+            if previous_validations:
+                logger.debug(
+                    "Validator received %d previous validation(s)", len(previous_validations)
+                )
+                for i, val in enumerate(previous_validations, 1):
+                    logger.debug("  Previous %d: Score %s%%", i, val.get("confidence_score", "N/A"))
+            else:
+                logger.debug("Validator received no previous validations")
 
         system_prompt = get_validation_system_prompt()
         user_prompt = get_validation_user_prompt(
@@ -157,17 +187,19 @@ class ValidatorAgent(Agent):
         )
 
         # Debug logging after validation
-        if previous_validations:
+        if previous_validations and logger.isEnabledFor(logging.DEBUG):
             prev_score = previous_validations[-1].get("confidence_score", 0)
             new_score = validation_result.confidence_score
             if new_score > prev_score:
-                print(
-                    f"\n[DEBUG] Score improved: {prev_score}% → {new_score}% "
-                    f"(+{new_score - prev_score} points)"
+                logger.debug(
+                    "Score improved: %s%% → %s%% (+%s points)",
+                    prev_score,
+                    new_score,
+                    new_score - prev_score,
                 )
             elif new_score == prev_score:
-                print(
-                    f"\n[DEBUG] Score unchanged: {new_score}% (check if gaps were actually covered)"
+                logger.debug(
+                    "Score unchanged: %s%% (check if gaps were actually covered)", new_score
                 )
 
         return validation_result
@@ -212,7 +244,6 @@ class ValidatorAgent(Agent):
             LLM generated response
         """
         if self.llm_client:
-            combined_input = f"{system_prompt}\n\n{user_prompt}"
-            return await self.llm_client.create_response(input=combined_input)
+            return await self.llm_client.create_response(system_prompt, user_prompt)
 
         return f"Validation results (unprocessed): {user_prompt}"
@@ -2,10 +2,8 @@
 
 import asyncio
 import contextlib
-import os
-import subprocess  # nosec B404
 import sys
-import tempfile
+from collections.abc import Callable
 from pathlib import Path
 
 from langchain_core.runnables import RunnableConfig
@@ -15,91 +13,134 @@ from langgraph_audio_agents.agents.researcher import ResearcherAgent
 from langgraph_audio_agents.agents.validator import ValidatorAgent
 from langgraph_audio_agents.config import settings
 from langgraph_audio_agents.domain.entities.conversation_state import ConversationState
+from langgraph_audio_agents.domain.interfaces.audio_service import AudioService
 from langgraph_audio_agents.domain.value_objects.message import Message
 from langgraph_audio_agents.graph.research_validation_graph import (
     create_research_validation_graph,
 )
-from langgraph_audio_agents.infrastructure.audio.elevenlabs_tts import ElevenLabsTTS
-from langgraph_audio_agents.infrastructure.audio.google_tts import GoogleTTS
-from langgraph_audio_agents.infrastructure.audio.groq_tts import GroqTTS
+from langgraph_audio_agents.infrastructure.audio.cached_tts import CachedAudioService
 from langgraph_audio_agents.infrastructure.llm.openai_client import OpenAIClient
 from langgraph_audio_agents.infrastructure.search.tavily_search import TavilySearch
 from langgraph_audio_agents.utils.checkpoint_utils import (
-    list_all_thread_ids,
+    configure_checkpoint_connection,
+    fetch_thread_ids,
     list_topics_for_user,
     list_users,
     normalize_thread_id,
 )
+from langgraph_audio_agents.utils.text import clip_text
 
 
-def play_audio_sync(audio_data: bytes, format: str = "wav") -> None:
-    """Play audio synchronously using mpv or ffplay.
+def _create_groq_tts() -> tuple[AudioService, AudioService]:
+    """Create researcher and validator Groq TTS services sharing one client."""
+    from langgraph_audio_agents.infrastructure.audio.groq_tts import GroqTTS
+
+    print("✓ Using Groq TTS")
+    tts = GroqTTS(settings.groq)
+    return tts, tts.with_validator_voice()
+
+
+def _create_google_tts() -> tuple[AudioService, AudioService]:
+    """Create researcher and validator Google Cloud TTS services sharing one client."""
+    from langgraph_audio_agents.infrastructure.audio.google_tts import GoogleTTS
+
+    print("✓ Using Google Cloud TTS")
+    tts = GoogleTTS(settings.google_tts)
+    return tts, tts.with_validator_voice()
+
+
+def _create_elevenlabs_tts() -> tuple[AudioService, AudioService]:
+    """Create researcher and validator ElevenLabs TTS services sharing one client."""
+    from langgraph_audio_agents.infrastructure.audio.elevenlabs_tts import ElevenLabsTTS
+
+    print("✓ Using ElevenLabs TTS")
+    tts = ElevenLabsTTS(settings.elevenlabs)
+    return tts, tts.with_validator_voice()
+
+
+# Provider SDKs are imported inside each factory so only the selected one is loaded
+_TTS_FACTORIES: dict[str, Callable[[], tuple[AudioService, AudioService]]] = {
+    "groq": _create_groq_tts,
+    "google": _create_google_tts,
+    "elevenlabs": _create_elevenlabs_tts,
+}
+
+
+# Audio player commands tried in order; each reads the audio from stdin
+_PLAYERS: tuple[tuple[str, ...], ...] = (
+    ("mpv", "--no-video", "--really-quiet", "-"),
+    ("ffplay", "-nodisp", "-autoexit", "-i", "pipe:0"),
+)
+
+
+async def play_audio(audio_data: bytes) -> None:
+    """Play audio using mpv or ffplay without blocking the event loop.
+
+    The players detect the container (wav or mp3) from the stream itself.
 
     Args:
         audio_data: Audio bytes to play
-        format: Audio format (wav or mp3)
     """
-    players = [
-        (["mpv", "--no-video", "--really-quiet"], "mpv"),
-        (["ffplay", "-nodisp", "-autoexit"], "ffplay"),
-    ]
-
-    for player_cmd, _player_name in players:
+    for player_cmd in _PLAYERS:
         try:
-            with tempfile.NamedTemporaryFile(suffix=f".{format}", delete=False) as temp_file:
-                temp_file.write(audio_data)
-                temp_path = temp_file.name
-
-            subprocess.run(  # nosec B603
-                player_cmd + [temp_path],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                check=True,
+            # Feed the audio through stdin so nothing is written to disk
+            process = await asyncio.create_subprocess_exec(
+                *player_cmd,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
             )
+            try:
+                await process.communicate(audio_data)
+            except asyncio.CancelledError:
+                # Do not leave the player running when playback is cancelled
+                process.kill()
+                await process.wait()
+                raise
 
-            os.unlink(temp_path)
-            return
+            if process.returncode == 0:
+                return
 
-        except FileNotFoundError:
-            continue
         except Exception:
-            with contextlib.suppress(Exception):
-                os.unlink(temp_path)
             continue
 
     print("⚠️  No audio player found. Install mpv or ffmpeg")
 
 
+async def audio_player(queue: asyncio.Queue[tuple[str, bytes] | None]) -> None:
+    """Play queued agent audio in order until a None sentinel is received.
+
+    Args:
+        queue: Queue of (agent name, audio bytes) items
+    """
+    while (item := await queue.get()) is not None:
+        agent_name, audio_data = item
+        print(f"   🔊 Playing {agent_name} audio...")
+        await play_audio(audio_data)
+        print(f"   ✓ {agent_name.capitalize()} audio finished\n")
+
+
 async def main() -> None:
     """Interactive CLI for research and validation with checkpoint persistence and audio."""
     print("🎤 Interactive Research & Validation Conversation")
     print("=" * 80)
     print("\nInitializing services...")
 
+    # Scan existing threads in a worker thread while the services are being built
+    db_path = Path(settings.checkpoint_db_path)
+    thread_ids_future = asyncio.get_running_loop().run_in_executor(None, fetch_thread_ids, db_path)
+
     tavily = TavilySearch(settings.tavily)
 
-    from langgraph_audio_agents.domain.interfaces.audio_service import (
-        AudioService,
-    )
+    tts_factory = _TTS_FACTORIES.get(settings.tts_provider, _create_elevenlabs_tts)
+    researcher_tts, validator_tts = tts_factory()
 
-    if settings.tts_provider == "groq":
-        researcher_tts: AudioService = GroqTTS(settings.groq)  # type: ignore[assignment]
-        validator_tts: AudioService = GroqTTS(settings.groq)  # type: ignore[assignment]
-        validator_tts.use_validator_voice()  # type: ignore[attr-defined]
-        audio_format = "wav"
-        print("✓ Using Groq TTS")
-    elif settings.tts_provider == "google":
-        researcher_tts = GoogleTTS(settings.google_tts)
-        validator_tts = GoogleTTS(settings.google_tts)
-        validator_tts.use_validator_voice()  # type: ignore[attr-defined]
-        audio_format = "mp3"
-        print("✓ Using Google Cloud TTS")
-    else:
-        researcher_tts = ElevenLabsTTS(settings.elevenlabs)
-        validator_tts = ElevenLabsTTS(settings.elevenlabs)
-        validator_tts.use_validator_voice()  # type: ignore[attr-defined]
-        audio_format = "mp3"
-        print("✓ Using ElevenLabs TTS")
+    researcher_tts = CachedAudioService(
+        researcher_tts, settings.tts_cache_path, max_disk_entries=settings.tts_cache_max_entries
+    )
+    validator_tts = CachedAudioService(
+        validator_tts, settings.tts_cache_path, max_disk_entries=settings.tts_cache_max_entries
+    )
 
     llm = OpenAIClient(settings.openai)
 
@@ -117,13 +158,13 @@ async def main() -> None:
 
     print("Creating graph with async SQLite checkpointer...")
     workflow = create_research_validation_graph(researcher, validator)
-    db_path = Path(settings.checkpoint_db_path)
 
     async with AsyncSqliteSaver.from_conn_string(str(db_path)) as checkpointer:
+        await configure_checkpoint_connection(checkpointer.conn)
         graph = workflow.compile(checkpointer=checkpointer)
 
         # Get all existing thread_ids from database
-        thread_ids = await list_all_thread_ids(db_path)
+        thread_ids = await thread_ids_future
 
         # Step 1: Select or create user
         print("\n" + "=" * 80)
@@ -208,15 +249,21 @@ async def main() -> None:
         print(f"\nUsing thread_id: {thread_id}")
         print("This allows you to continue the conversation across multiple runs!\n")
 
-        # Check if we have previous state
+        # Load previous state once: it is shown here and reused for the new turn below
+        existing_messages = []
+        existing_metadata = {}
         try:
             previous_state = await graph.aget_state(config)
-            if previous_state.values and previous_state.values.get("messages"):
+            if previous_state.values:
+                existing_messages = previous_state.values.get("messages", [])
+                # Preserve metadata from previous state (includes validation_history)
+                existing_metadata = previous_state.values.get("metadata", {})
+            if existing_messages:
                 print("=" * 80)
                 print("PREVIOUS CONVERSATION FOUND!")
                 print("=" * 80)
-                for i, msg in enumerate(previous_state.values["messages"], 1):
-                    print(f"{i}. [{msg.role}]: {msg.content[:100]}...")
+                for i, msg in enumerate(existing_messages, 1):
+                    print(f"{i}. [{msg.role}]: {clip_text(msg.content, 100)}")
                 print("\nContinuing conversation...\n")
         except Exception:
             print("No previous conversation found. Starting fresh!\n")
@@ -228,20 +275,6 @@ async def main() -> None:
 
         print(f"\nUser query: {user_query}\n")
 
-        # Get existing state and append new message
-        try:
-            previous_state = await graph.aget_state(config)
-            if previous_state.values:
-                existing_messages = previous_state.values.get("messages", [])
-                # Preserve metadata from previous state (includes validation_history)
-                existing_metadata = previous_state.values.get("metadata", {})
-            else:
-                existing_messages = []
-                existing_metadata = {}
-        except Exception:
-            existing_messages = []
-            existing_metadata = {}
-
         initial_state = ConversationState(
             messages=existing_messages + [Message(role="user", content=user_query)],
             user_query=user_query,
@@ -251,37 +284,46 @@ async def main() -> None:
         print("Running research + validation workflow...")
         print("=" * 80)
 
-        # Stream events to capture both agent responses and play audio sequentially
+        # Stream events to capture both agent responses; audio plays in the background so
+        # the researcher's clip overlaps with validation instead of stalling the graph
         researcher_data = None
         validator_data = None
+        audio_queue: asyncio.Queue[tuple[str, bytes] | None] = asyncio.Queue()
+        player_task = asyncio.create_task(audio_player(audio_queue))
 
-        async for event in graph.astream(initial_state, config=config):  # type: ignore[arg-type]
-            if "researcher" in event:
-                researcher_data = event["researcher"]
-                print("\n🔬 Researcher says:")
-                print(f"   {researcher_data['messages'][-1].content[:200]}...")
-
-                # Play researcher audio
-                if researcher_data.get("audio_data"):
-                    print("   🔊 Playing researcher audio...")
-                    play_audio_sync(researcher_data["audio_data"], audio_format)
-                    print("   ✓ Audio finished\n")
-
-            if "validator" in event:
-                validator_data = event["validator"]
-                confidence = validator_data["metadata"].get("confidence_score", "N/A")
-                is_validated = validator_data.get("is_validated", False)
-                status = "✓ VALIDATED" if is_validated else "✗ NOT VALIDATED"
-
-                print("\n✅ Validator says:")
-                print(f"   {validator_data['messages'][-1].content[:200]}...")
-                print(f"   📊 Confidence: {confidence}% - {status}")
-
-                # Play validator audio
-                if validator_data.get("audio_data"):
-                    print("   🔊 Playing validator audio...")
-                    play_audio_sync(validator_data["audio_data"], audio_format)
-                    print("   ✓ Audio finished\n")
+        try:
+            async for event in graph.astream(initial_state, config=config):  # type: ignore[arg-type]
+                if "researcher" in event:
+                    researcher_data = event["researcher"]
+                    print("\n🔬 Researcher says:")
+                    print(f"   {clip_text(researcher_data['messages'][-1].content, 200)}")
+
+                # Play researcher audio once its synthesis node finishes
+                if "researcher_tts" in event and event["researcher_tts"].get("audio_data"):
+                    await audio_queue.put(("researcher", event["researcher_tts"]["audio_data"]))
+
+                if "validator" in event:
+                    validator_data = event["validator"]
+                    confidence = validator_data["metadata"].get("confidence_score", "N/A")
+                    is_validated = validator_data.get("is_validated", False)
+                    status = "✓ VALIDATED" if is_validated else "✗ NOT VALIDATED"
+
+                    print("\n✅ Validator says:")
+                    print(f"   {clip_text(validator_data['messages'][-1].content, 200)}")
+                    print(f"   📊 Confidence: {confidence}% - {status}")
+
+                # Play validator audio once its synthesis node finishes
+                if "validator_tts" in event and event["validator_tts"].get("audio_data"):
+                    await audio_queue.put(("validator", event["validator_tts"]["audio_data"]))
+        except BaseException:
+            # On an error or Ctrl-C stop playback instead of orphaning the player task
+            player_task.cancel()
+            raise
+        finally:
+            # Let queued audio finish (or the cancelled player wind down) before moving on
+            await audio_queue.put(None)
+            with contextlib.suppress(asyncio.CancelledError):
+                await player_task
 
         print("\n" + "=" * 80)
         print("RESULTS")
@@ -304,8 +346,14 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
+    # Run on uvloop where it is installed; it does not ship Windows wheels
+    try:
+        from uvloop import run
+    except ImportError:
+        from asyncio import run
+
     try:
-        asyncio.run(main())
+        run(main())
     except KeyboardInterrupt:
         print("\n\n👋 Goodbye!")
         sys.exit(0)
@@ -141,6 +141,15 @@ class Settings(BaseSettings):
         default="checkpoints.db",
         description="Path to checkpoint database file",
     )
+    tts_cache_path: str = Field(
+        default="tts_cache.db",
+        description="Path to SQLite file caching synthesized audio",
+    )
+    tts_cache_max_entries: int = Field(
+        default=1000,
+        description="Maximum number of synthesized clips kept in the TTS cache file",
+        gt=0,
+    )
     elevenlabs: ElevenLabsSettings = Field(
         default_factory=ElevenLabsSettings,
         description="ElevenLabs TTS configuration",
@@ -1,13 +1,15 @@
 """Agent response model."""
 
-from typing import Any
+from typing import Any, ClassVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class AgentResponse(BaseModel):
     """Response from an agent."""
 
+    model_config: ClassVar[ConfigDict] = ConfigDict(frozen=True, extra="forbid")
+
     content: str = Field(default="", description="Agent's detailed response content (text)")
     audio_summary: str = Field(
         default="", description="Conversational summary for audio generation"
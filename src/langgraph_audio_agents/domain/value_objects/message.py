@@ -1,12 +1,28 @@
 """Message model for conversation."""
 
-from pydantic import BaseModel, Field
+from functools import cached_property
+from typing import ClassVar
+
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Message(BaseModel):
     """Represents a message in the conversation."""
 
+    model_config: ClassVar[ConfigDict] = ConfigDict(frozen=True, extra="forbid")
+
     role: str = Field(
-        default="user", description="Role of the message sender (user, agent, system)"
+        default="user", description="Role of the message sender (user, agent, system, summary)"
     )
     content: str = Field(default="", description="Content of the message")
+
+    @cached_property
+    def is_summary(self) -> bool:
+        """Whether this message carries a conversation summary.
+
+        Summaries are tagged with role="summary". Checkpoints written before that role
+        existed stored them as system messages, which are still recognized by content.
+        """
+        if self.role == "summary":
+            return True
+        return self.role == "system" and "summary" in self.content.lower()
@@ -1,11 +1,15 @@
 """Research synthesis value object."""
 
-from pydantic import BaseModel, Field
+from typing import ClassVar
+
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ResearchSynthesis(BaseModel):
     """Synthesized research findings from search results."""
 
+    model_config: ClassVar[ConfigDict] = ConfigDict(frozen=True, extra="forbid")
+
     answer: str = Field(
         ...,
         description="Clear, concise answer to the user's question based on search results",
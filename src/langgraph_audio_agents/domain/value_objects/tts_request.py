@@ -1,11 +1,15 @@
 """Text-to-Speech request model."""
 
-from pydantic import BaseModel, Field
+from typing import ClassVar
+
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class TTSRequest(BaseModel):
     """Request model for text-to-speech conversion."""
 
+    model_config: ClassVar[ConfigDict] = ConfigDict(frozen=True, extra="forbid")
+
     text: str = Field(default="", description="Text to convert to speech", min_length=1)
     voice_id: str = Field(default="", description="Voice ID to use for synthesis")
     model_id: str = Field(
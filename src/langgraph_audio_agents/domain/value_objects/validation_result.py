@@ -1,11 +1,15 @@
 """Validation result value object."""
 
-from pydantic import BaseModel, Field
+from typing import ClassVar
+
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ValidationResult(BaseModel):
     """Validation result representing the assessment of research findings."""
 
+    model_config: ClassVar[ConfigDict] = ConfigDict(frozen=True, extra="forbid")
+
     confidence_score: int = Field(
         ...,
         ge=0,
@@ -1,5 +1,8 @@
 """LangGraph nodes for agent workflows."""
 
+import asyncio
+import logging
+from collections import deque
 from typing import Any
 
 from langgraph_audio_agents.agents.researcher import ResearcherAgent
@@ -8,6 +11,24 @@ from langgraph_audio_agents.domain.entities.conversation_state import Conversati
 from langgraph_audio_agents.domain.value_objects.message import Message
 from langgraph_audio_agents.utils.context_manager import manage_conversation_context
 
+logger = logging.getLogger(__name__)
+
+
+def _to_validation_entry(metadata: dict[str, Any]) -> dict[str, Any]:
+    """Extract a validation history entry from validator metadata.
+
+    Args:
+        metadata: Metadata produced by the validator agent
+
+    Returns:
+        Entry with confidence_score, assessment and is_validated
+    """
+    return {
+        "confidence_score": metadata.get("confidence_score"),
+        "assessment": metadata.get("assessment", ""),
+        "is_validated": metadata.get("is_validated", False),
+    }
+
 
 async def researcher_node(
     state: ConversationState, researcher_agent: ResearcherAgent
@@ -19,18 +40,39 @@ async def researcher_node(
         researcher_agent: Initialized researcher agent
 
     Returns:
-        Updated state with research results
+        Updated state with research results (audio is produced by researcher_tts_node)
     """
-    response = await researcher_agent.process(state.messages)
+    response = await researcher_agent.research(state.messages, state.metadata)
+    # The summary is produced by our own agent, so field validation is skipped
+    agent_message = Message.model_construct(role="agent", content=response.audio_summary)
 
     return {
         "research_result": response.content,
-        "audio_data": response.audio_data,
-        "messages": state.messages + [Message(role="agent", content=response.audio_summary)],
+        "messages": [*state.messages, agent_message],
         "metadata": {**state.metadata, **response.metadata},
     }
 
 
+async def researcher_tts_node(
+    state: ConversationState, researcher_agent: ResearcherAgent
+) -> dict[str, Any]:
+    """Node that converts the researcher's audio summary to speech.
+
+    Runs alongside validator_node, so the researcher's speech is synthesized while
+    the validator's LLM calls are in flight.
+
+    Args:
+        state: Current conversation state (last message is the researcher's summary)
+        researcher_agent: Initialized researcher agent
+
+    Returns:
+        Updated state with the researcher audio
+    """
+    audio_data = await researcher_agent.synthesize_audio(state.messages[-1].content)
+
+    return {"audio_data": audio_data}
+
+
 async def validator_node(
     state: ConversationState, validator_agent: ValidatorAgent
 ) -> dict[str, Any]:
@@ -41,76 +83,88 @@ async def validator_node(
         validator_agent: Initialized validator agent
 
     Returns:
-        Updated state with validation results
+        Updated state with validation results (audio is produced by validator_tts_node)
     """
     # Extract previous validation results from metadata
-    # Build validation history from state metadata
-    validation_history = []
+    # Build validation history from state metadata (only the last 2 validations are kept)
+    validation_history: deque[dict[str, Any]] = deque(maxlen=2)
     if state.metadata:
         # Look for validation metadata in state
         if "validation_history" in state.metadata:
-            validation_history = state.metadata.get("validation_history", [])
+            validation_history.extend(state.metadata.get("validation_history", []))
         else:
             # Extract from current metadata if it has validation info
             if "confidence_score" in state.metadata:
-                validation_history = [
-                    {
-                        "confidence_score": state.metadata.get("confidence_score"),
-                        "assessment": state.metadata.get("assessment", ""),
-                        "is_validated": state.metadata.get("is_validated", False),
-                    }
-                ]
+                validation_history.append(_to_validation_entry(state.metadata))
 
     # Debug logging - show what's in state.metadata
-    metadata_keys = list(state.metadata.keys()) if state.metadata else "None"
-    print(f"\n[DEBUG] State metadata keys: {metadata_keys}")
-    if validation_history:
-        print(f"[DEBUG] Validation history found: {len(validation_history)} previous validation(s)")
-        for i, val in enumerate(validation_history, 1):
-            print(f"  Validation {i}: Score {val.get('confidence_score', 'N/A')}%")
-            print(f"    Assessment preview: {val.get('assessment', '')[:100]}...")
-    else:
-        print("[DEBUG] No previous validation history found")
-        if state.metadata:
-            print(f"[DEBUG] Available metadata keys: {list(state.metadata.keys())}")
-            if "confidence_score" in state.metadata:
-                score = state.metadata.get("confidence_score")
-                print(f"[DEBUG] Found confidence_score in metadata: {score}")
-                assessment_preview = state.metadata.get("assessment", "")[:100]
-                print(f"[DEBUG] Found assessment in metadata: {assessment_preview}...")
+    if logger.isEnabledFor(logging.DEBUG):
+        metadata_keys = list(state.metadata.keys()) if state.metadata else "None"
+        logger.debug("State metadata keys: %s", metadata_keys)
+        if validation_history:
+            logger.debug(
+                "Validation history found: %d previous validation(s)", len(validation_history)
+            )
+            for i, val in enumerate(validation_history, 1):
+                logger.debug(
+                    "  Validation %d: Score %s%% - assessment preview: %s...",
+                    i,
+                    val.get("confidence_score", "N/A"),
+                    val.get("assessment", "")[:100],
+                )
+        else:
+            logger.debug("No previous validation history found")
 
-    response = await validator_agent.process(
-        state.messages, previous_validations=validation_history if validation_history else None
+    validation = validator_agent.validate(
+        state.messages,
+        previous_validations=list(validation_history) if validation_history else None,
     )
 
+    # Summarize conversation if needed (requires LLM client from validator). Only whole
+    # earlier exchanges are summarized, never the current one, so the history can be
+    # compacted while the validator's own LLM calls are in flight.
+    if validator_agent.llm_client:
+        response, history = await asyncio.gather(
+            validation,
+            manage_conversation_context(
+                state.messages,
+                validator_agent.llm_client,
+                max_exchanges=5,
+                max_tokens=10000,
+            ),
+        )
+    else:
+        response, history = await validation, state.messages
+
     # Update validation history in metadata
     updated_metadata = {**state.metadata, **response.metadata}
-    validation_history.append(
-        {
-            "confidence_score": response.metadata.get("confidence_score"),
-            "assessment": response.metadata.get("assessment", ""),
-            "is_validated": response.metadata.get("is_validated", False),
-        }
-    )
-    # Keep only last 2 validations
-    updated_metadata["validation_history"] = validation_history[-2:]
-
-    # Manage conversation context (summarize if needed)
-    updated_messages = state.messages + [Message(role="agent", content=response.audio_summary)]
+    validation_history.append(_to_validation_entry(response.metadata))
+    # The deque already dropped older entries; checkpoints store a plain list
+    updated_metadata["validation_history"] = list(validation_history)
 
-    # Summarize conversation if needed (requires LLM client from validator)
-    if validator_agent.llm_client:
-        updated_messages = await manage_conversation_context(
-            updated_messages,
-            validator_agent.llm_client,
-            max_exchanges=5,
-            max_tokens=10000,
-        )
+    agent_message = Message.model_construct(role="agent", content=response.audio_summary)
+    updated_messages = [*history, agent_message]
 
     return {
         "validation_result": response.content,
         "is_validated": response.metadata.get("is_validated", False),
-        "audio_data": response.audio_data,
         "messages": updated_messages,
         "metadata": updated_metadata,
     }
+
+
+async def validator_tts_node(
+    state: ConversationState, validator_agent: ValidatorAgent
+) -> dict[str, Any]:
+    """Node that converts the validator's audio summary to speech.
+
+    Args:
+        state: Current conversation state (last message is the validator's summary)
+        validator_agent: Initialized validator agent
+
+    Returns:
+        Updated state with the validator audio
+    """
+    audio_data = await validator_agent.synthesize_audio(state.messages[-1].content)
+
+    return {"audio_data": audio_data}
@@ -7,7 +7,12 @@ from langgraph.graph import END, StateGraph
 from langgraph_audio_agents.agents.researcher import ResearcherAgent
 from langgraph_audio_agents.agents.validator import ValidatorAgent
 from langgraph_audio_agents.domain.entities.conversation_state import ConversationState
-from langgraph_audio_agents.graph.nodes import researcher_node, validator_node
+from langgraph_audio_agents.graph.nodes import (
+    researcher_node,
+    researcher_tts_node,
+    validator_node,
+    validator_tts_node,
+)
 
 
 def create_research_validation_graph(
@@ -16,6 +21,10 @@ def create_research_validation_graph(
 ) -> StateGraph[ConversationState]:
     """Create a graph with researcher and validator agents in sequence.
 
+    Speech synthesis runs in separate nodes so each agent's text is emitted as its own
+    stream event before the audio is ready. The researcher's synthesis runs in parallel
+    with the validator, overlapping the TTS round-trip with the validator's LLM calls.
+
     Args:
         researcher_agent: Initialized researcher agent
         validator_agent: Initialized validator agent
@@ -28,14 +37,25 @@ def create_research_validation_graph(
     async def _researcher_node(state: ConversationState) -> dict[str, Any]:
         return await researcher_node(state, researcher_agent)
 
+    async def _researcher_tts_node(state: ConversationState) -> dict[str, Any]:
+        return await researcher_tts_node(state, researcher_agent)
+
     async def _validator_node(state: ConversationState) -> dict[str, Any]:
         return await validator_node(state, validator_agent)
 
+    async def _validator_tts_node(state: ConversationState) -> dict[str, Any]:
+        return await validator_tts_node(state, validator_agent)
+
     workflow.add_node("researcher", _researcher_node)
+    workflow.add_node("researcher_tts", _researcher_tts_node)
     workflow.add_node("validator", _validator_node)
+    workflow.add_node("validator_tts", _validator_tts_node)
 
     workflow.set_entry_point("researcher")
+    workflow.add_edge("researcher", "researcher_tts")
     workflow.add_edge("researcher", "validator")
-    workflow.add_edge("validator", END)
+    workflow.add_edge("researcher_tts", END)
+    workflow.add_edge("validator", "validator_tts")
+    workflow.add_edge("validator_tts", END)
 
     return workflow
@@ -0,0 +1,123 @@
+"""Content-addressed cache for text-to-speech output."""
+
+import asyncio
+import hashlib
+import sqlite3
+from collections import OrderedDict
+from contextlib import closing
+from pathlib import Path
+
+from langgraph_audio_agents.domain.interfaces.audio_service import AudioService
+
+
+class CachedAudioService(AudioService):
+    """AudioService decorator that memoizes synthesized audio by voice, model and text.
+
+    Hits are served from a small in-process LRU first, then from an on-disk SQLite
+    table, so identical summaries never reach the TTS provider twice. Disk access runs
+    in a worker thread to keep the event loop free.
+    """
+
+    def __init__(
+        self,
+        service: AudioService,
+        db_path: str | Path,
+        max_memory_entries: int = 128,
+        max_disk_entries: int = 1000,
+    ):
+        """Initialize cached audio service.
+
+        Args:
+            service: Wrapped TTS service that performs the actual synthesis
+            db_path: Path to SQLite file used as persistent cache
+            max_memory_entries: Number of recent results kept in memory
+            max_disk_entries: Number of results kept on disk; the oldest are pruned first
+        """
+        self.service = service
+        self.db_path = Path(db_path)
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_entries = max_disk_entries
+        self._memory: OrderedDict[bytes, bytes] = OrderedDict()
+
+        with closing(sqlite3.connect(self.db_path)) as conn, conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS tts_cache (key BLOB PRIMARY KEY, audio BLOB)")
+
+    def _cache_key(self, text: str) -> bytes:
+        """Build the content-addressed key for a synthesis request.
+
+        Args:
+            text: Text to convert to speech
+
+        Returns:
+            SHA-256 digest of voice, model, output format and text
+        """
+        # Model and format are part of the key so a settings change never replays stale audio
+        service_settings = getattr(self.service, "settings", None)
+        parts = (
+            getattr(self.service, "voice_id", ""),
+            getattr(service_settings, "model_id", ""),
+            getattr(service_settings, "output_format", ""),
+            text,
+        )
+        return hashlib.sha256("\0".join(parts).encode()).digest()
+
+    def _remember(self, key: bytes, audio: bytes) -> None:
+        """Store audio in the in-process LRU, evicting the oldest entry when full."""
+        self._memory[key] = audio
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _read(self, key: bytes) -> bytes | None:
+        """Read cached audio from disk (blocking)."""
+        with closing(sqlite3.connect(self.db_path)) as conn:
+            row = conn.execute("SELECT audio FROM tts_cache WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _write(self, key: bytes, audio: bytes) -> None:
+        """Write audio to disk and prune the oldest rows beyond the cap (blocking)."""
+        with closing(sqlite3.connect(self.db_path)) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO tts_cache (key, audio) VALUES (?, ?)", (key, audio)
+            )
+            # A replaced row gets a new rowid, so rowid order is insertion order
+            conn.execute(
+                "DELETE FROM tts_cache WHERE rowid <= "
+                "(SELECT rowid FROM tts_cache ORDER BY rowid DESC LIMIT 1 OFFSET ?)",
+                (self.max_disk_entries,),
+            )
+
+    async def _lookup(self, key: bytes) -> bytes | None:
+        """Return cached audio from memory or disk, or None on a miss."""
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return self._memory[key]
+
+        audio = await asyncio.to_thread(self._read, key)
+        if audio is not None:
+            self._remember(key, audio)
+        return audio
+
+    async def _store(self, key: bytes, audio: bytes) -> None:
+        """Persist freshly synthesized audio to disk and memory."""
+        await asyncio.to_thread(self._write, key, audio)
+        self._remember(key, audio)
+
+    async def synthesize(self, text: str) -> bytes:
+        """Convert text to audio, reusing a cached result when available.
+
+        Args:
+            text: Text to convert to speech
+
+        Returns:
+            Audio data as bytes
+        """
+        key = self._cache_key(text)
+
+        cached = await self._lookup(key)
+        if cached is not None:
+            return cached
+
+        audio = await self.service.synthesize(text)
+        await self._store(key, audio)
+        return audio
@@ -1,6 +1,9 @@
 """ElevenLabs Text-to-Speech implementation."""
 
-import io
+import asyncio
+import copy
+from functools import cache
+from typing import Self
 
 from elevenlabs.client import ElevenLabs
 
@@ -9,6 +12,19 @@ from langgraph_audio_agents.domain.interfaces.audio_service import AudioService
 from langgraph_audio_agents.domain.value_objects.tts_request import TTSRequest
 
 
+@cache
+def _get_client(api_key: str) -> ElevenLabs:
+    """Return the process-wide ElevenLabs client for an API key.
+
+    Args:
+        api_key: ElevenLabs API key
+
+    Returns:
+        Shared client, so every service instance reuses one connection pool
+    """
+    return ElevenLabs(api_key=api_key)
+
+
 class ElevenLabsTTS(AudioService):
     """ElevenLabs text-to-speech service implementation."""
 
@@ -21,7 +37,7 @@ class ElevenLabsTTS(AudioService):
         """
         self.settings = settings
         self.voice_id = voice_id or settings.researcher_voice_id
-        self.client = ElevenLabs(api_key=settings.api_key.get_secret_value())
+        self.client = _get_client(settings.api_key.get_secret_value())
 
     async def synthesize(self, text: str) -> bytes:
         """Convert text to audio using ElevenLabs.
@@ -40,6 +56,18 @@ class ElevenLabsTTS(AudioService):
             output_format=self.settings.output_format,
         )
 
+        # The SDK is blocking, so run it off the event loop
+        return await asyncio.to_thread(self._convert, request)
+
+    def _convert(self, request: TTSRequest) -> bytes:
+        """Run the blocking ElevenLabs conversion and collect the audio.
+
+        Args:
+            request: Validated synthesis request
+
+        Returns:
+            Audio data as bytes
+        """
         # ElevenLabs returns an iterator of audio chunks
         audio_generator = self.client.text_to_speech.convert(
             text=request.text,
@@ -48,13 +76,17 @@ class ElevenLabsTTS(AudioService):
             output_format=request.output_format,
         )
 
-        # Collect all audio chunks into bytes
-        audio_bytes = io.BytesIO()
-        for chunk in audio_generator:
-            audio_bytes.write(chunk)
+        # Collect all audio chunks into bytes with a single final allocation
+        return b"".join(audio_generator)
 
-        return audio_bytes.getvalue()
+    def with_validator_voice(self) -> Self:
+        """Return a copy that speaks with the validator voice from settings.
 
-    def use_validator_voice(self) -> None:
-        """Switch to validator voice from settings."""
-        self.voice_id = self.settings.validator_voice_id
+        The copy shares this instance's client, so both agents reuse one connection pool.
+
+        Returns:
+            TTS service using validator_voice_id
+        """
+        clone = copy.copy(self)
+        clone.voice_id = self.settings.validator_voice_id
+        return clone
@@ -1,5 +1,10 @@
 """Google Cloud Text-to-Speech implementation."""
 
+import asyncio
+import copy
+from functools import lru_cache
+from typing import Self
+
 from google.cloud import texttospeech as tts
 
 from langgraph_audio_agents.config import GoogleTTSSettings
@@ -7,6 +12,16 @@ from langgraph_audio_agents.domain.interfaces.audio_service import AudioService
 from langgraph_audio_agents.domain.value_objects.tts_request import TTSRequest
 
 
+@lru_cache(maxsize=1)
+def _get_client() -> tts.TextToSpeechClient:
+    """Return the process-wide Google Cloud TTS client.
+
+    Returns:
+        Shared client, so every service instance reuses one gRPC channel
+    """
+    return tts.TextToSpeechClient()
+
+
 class GoogleTTS(AudioService):
     """Google Cloud text-to-speech service implementation."""
 
@@ -19,7 +34,7 @@ class GoogleTTS(AudioService):
         """
         self.settings = settings
         self.voice_id = voice_id or settings.researcher_voice_id
-        self.client = tts.TextToSpeechClient()
+        self.client = _get_client()
 
     async def synthesize(self, text: str) -> bytes:
         """Convert text to audio using Google Cloud TTS.
@@ -52,8 +67,9 @@ class GoogleTTS(AudioService):
         # Synthesis input
         synthesis_input = tts.SynthesisInput(text=request.text)
 
-        # Perform synthesis
-        response = self.client.synthesize_speech(
+        # Perform synthesis; the SDK is blocking, so run it off the event loop
+        response = await asyncio.to_thread(
+            self.client.synthesize_speech,
             input=synthesis_input,
             voice=voice_params,
             audio_config=audio_config,
@@ -61,6 +77,14 @@ class GoogleTTS(AudioService):
 
         return response.audio_content
 
-    def use_validator_voice(self) -> None:
-        """Switch to validator voice from settings."""
-        self.voice_id = self.settings.validator_voice_id
+    def with_validator_voice(self) -> Self:
+        """Return a copy that speaks with the validator voice from settings.
+
+        The copy shares this instance's client, so both agents reuse one connection pool.
+
+        Returns:
+            TTS service using validator_voice_id
+        """
+        clone = copy.copy(self)
+        clone.voice_id = self.settings.validator_voice_id
+        return clone
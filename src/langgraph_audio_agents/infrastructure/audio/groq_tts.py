@@ -1,8 +1,9 @@
 """Groq Text-to-Speech implementation."""
 
-from typing import Literal, cast
+import copy
+from typing import Literal, Self, cast
 
-from groq import Groq
+from groq import AsyncGroq
 
 from langgraph_audio_agents.config import GroqSettings
 from langgraph_audio_agents.domain.interfaces.audio_service import AudioService
@@ -21,7 +22,7 @@ class GroqTTS(AudioService):
         """
         self.settings = settings
         self.voice_id = voice_id or settings.researcher_voice_id
-        self.client = Groq(api_key=settings.api_key.get_secret_value())
+        self.client = AsyncGroq(api_key=settings.api_key.get_secret_value())
 
     async def synthesize(self, text: str) -> bytes:
         """Convert text to audio using Groq.
@@ -43,15 +44,23 @@ class GroqTTS(AudioService):
             Literal["mp3", "wav"], request.output_format
         )
 
-        response = self.client.audio.speech.create(
+        response = await self.client.audio.speech.create(
             model=request.model_id,
             voice=request.voice_id,
             input=request.text,
             response_format=response_format_literal,
         )
 
-        return response.read()
+        return await response.read()
 
-    def use_validator_voice(self) -> None:
-        """Switch to validator voice from settings."""
-        self.voice_id = self.settings.validator_voice_id
+    def with_validator_voice(self) -> Self:
+        """Return a copy that speaks with the validator voice from settings.
+
+        The copy shares this instance's client, so both agents reuse one connection pool.
+
+        Returns:
+            TTS service using validator_voice_id
+        """
+        clone = copy.copy(self)
+        clone.voice_id = self.settings.validator_voice_id
+        return clone
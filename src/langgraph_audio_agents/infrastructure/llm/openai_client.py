@@ -2,7 +2,7 @@
 
 from typing import TypeVar
 
-from openai import OpenAI
+from openai import AsyncOpenAI
 from pydantic import BaseModel
 
 from langgraph_audio_agents.config import OpenAISettings
@@ -20,21 +20,30 @@ class OpenAIClient:
             settings: OpenAI settings from config (includes API key, model, etc.)
         """
         self.settings = settings
-        self.client = OpenAI(api_key=settings.api_key.get_secret_value())
+        self.client = AsyncOpenAI(api_key=settings.api_key.get_secret_value())
 
-    async def create_response(self, input: str, model: str | None = None) -> str:
+    async def create_response(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        model: str | None = None,
+    ) -> str:
         """Create a model response using OpenAI Responses API.
 
         Args:
-            input: Text input for the model
+            system_prompt: System instructions
+            user_prompt: User query/context
             model: Model to use (defaults to settings.model)
 
         Returns:
             Text response from the model
         """
-        response = self.client.responses.create(
+        response = await self.client.responses.create(
             model=model or self.settings.model,
-            input=input,
+            input=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
             temperature=self.settings.temperature,
             max_output_tokens=self.settings.max_output_tokens,
         )
@@ -65,7 +74,7 @@ class OpenAIClient:
         # Use higher default for structured outputs to prevent JSON truncation
         output_tokens = max_output_tokens if max_output_tokens is not None else 2000
 
-        response = self.client.responses.parse(
+        response = await self.client.responses.parse(
             model=model or self.settings.model,
             input=[
                 {"role": "system", "content": system_prompt},
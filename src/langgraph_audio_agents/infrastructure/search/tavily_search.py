@@ -1,6 +1,6 @@
 """Tavily search service implementation."""
 
-from tavily import TavilyClient
+from tavily import AsyncTavilyClient
 
 from langgraph_audio_agents.config import TavilySettings
 from langgraph_audio_agents.domain.interfaces.search_service import SearchService
@@ -16,7 +16,7 @@ class TavilySearch(SearchService):
             settings: Tavily settings from config (includes API key)
         """
         self.settings = settings
-        self.client = TavilyClient(api_key=settings.api_key.get_secret_value())
+        self.client = AsyncTavilyClient(api_key=settings.api_key.get_secret_value())
 
     async def search(self, query: str) -> str:
         """Search for information using Tavily.
@@ -27,7 +27,7 @@ class TavilySearch(SearchService):
         Returns:
             Search results as formatted text
         """
-        response = self.client.search(
+        response = await self.client.search(
             query=query,
             max_results=self.settings.max_results,
             search_depth=self.settings.search_depth,
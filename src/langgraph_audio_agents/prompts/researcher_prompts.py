@@ -1,6 +1,9 @@
 """Prompts for the researcher agent."""
 
+from collections import deque
+
 from langgraph_audio_agents.domain.value_objects.message import Message
+from langgraph_audio_agents.utils.text import clip_text
 
 
 def get_synthesis_system_prompt() -> str:
@@ -38,12 +41,17 @@ def get_synthesis_user_prompt(
     """
     prompt_parts = []
 
-    # Include summary if present (system messages with summaries)
-    summary_messages = [
-        msg
-        for msg in (conversation_history or [])
-        if msg.role == "system" and "summary" in msg.content.lower()
-    ]
+    # Split history in one pass: summary messages vs. the last 6 user/agent messages.
+    # Summaries can sit anywhere in the history, so the scan cannot stop early.
+    summary_messages = []
+    recent_messages: deque[Message] = deque(maxlen=6)
+    for msg in conversation_history or []:
+        if msg.is_summary:
+            summary_messages.append(msg)
+        elif msg.role in ("user", "agent"):
+            recent_messages.append(msg)
+
+    # Include summary if present
     if summary_messages:
         prompt_parts.append("Previous conversation summary:")
         for summary_msg in summary_messages:
@@ -51,26 +59,15 @@ def get_synthesis_user_prompt(
         prompt_parts.append("")
 
     # Include recent conversation context (last 3-4 messages, excluding summary)
-    if conversation_history and len(conversation_history) > 2:
-        # Filter out summary messages, keep only user/agent messages
-        recent_messages = [
-            msg
-            for msg in conversation_history
-            if msg.role in ("user", "agent") and "summary" not in msg.content.lower()
-        ]
-        if recent_messages:
-            # Get last 4-6 messages (2-3 exchanges, excluding current query)
-            if len(recent_messages) > 6:
-                messages_to_include = recent_messages[-6:-1]
-            else:
-                messages_to_include = recent_messages[:-1]
-            if messages_to_include:
-                prompt_parts.append("Recent conversation context:")
-                for msg in messages_to_include:
-                    role_label = "User" if msg.role == "user" else "Assistant"
-                    content = msg.content[:300] + "..." if len(msg.content) > 300 else msg.content
-                    prompt_parts.append(f"  {role_label}: {content}")
-                prompt_parts.append("")
+    if conversation_history and len(conversation_history) > 2 and recent_messages:
+        # Up to 5 messages (2-3 exchanges), excluding the current query
+        messages_to_include = list(recent_messages)[:-1]
+        if messages_to_include:
+            prompt_parts.append("Recent conversation context:")
+            for msg in messages_to_include:
+                role_label = "User" if msg.role == "user" else "Assistant"
+                prompt_parts.append(f"  {role_label}: {clip_text(msg.content)}")
+            prompt_parts.append("")
 
     prompt_parts.append(f"Current User Question: {query}")
     prompt_parts.append("")
@@ -116,18 +113,16 @@ def get_audio_summary_user_prompt(
     Returns:
         User prompt for audio summary generation
     """
-    prompt_parts = [f'You just researched: "{query}"', ""]
-
-    if conversation_history and len(conversation_history) > 2:
-        prompt_parts.append("This is part of an ongoing conversation.")
-        prompt_parts.append("")
+    ongoing = (
+        "This is part of an ongoing conversation.\n\n"
+        if conversation_history and len(conversation_history) > 2
+        else ""
+    )
 
-    prompt_parts.append("Your detailed findings:")
-    prompt_parts.append(detailed_content)
-    prompt_parts.append("")
-    prompt_parts.append(
+    return (
+        f'You just researched: "{query}"\n\n'
+        f"{ongoing}"
+        f"Your detailed findings:\n{detailed_content}\n\n"
         "Now, verbally share your key findings in a natural, conversational way (2-3 sentences). "
         "If this continues a previous topic, reference it naturally."
     )
-
-    return "\n".join(prompt_parts)
@@ -1,8 +1,20 @@
 """Prompts for the validator agent."""
 
+from collections import deque
 from typing import Any
 
 from langgraph_audio_agents.domain.value_objects.message import Message
+from langgraph_audio_agents.utils.text import clip_text
+
+_SEPARATOR = "=" * 80
+
+# Framing around the previous validation history block. Validation instructions live in
+# the system prompt, so the user prompt carries only per-turn data.
+_HISTORY_HEADER: tuple[str, ...] = (
+    _SEPARATOR,
+    "PREVIOUS VALIDATION HISTORY - CRITICAL FOR SCORE IMPROVEMENT",
+    _SEPARATOR,
+)
 
 
 def get_validation_system_prompt() -> str:
@@ -32,7 +44,23 @@ You must provide:
    - 71-85: Good quality, minor issues
    - 86-100: Excellent quality
 2. A detailed assessment explaining your score, explicitly mentioning if previously identified
-   gaps have been addressed and how this affects the score."""
+   gaps have been addressed and how this affects the score.
+
+For the research findings, address:
+1. Is the information accurate and relevant to the question?
+2. Are there any factual errors or inconsistencies?
+3. Is any critical information missing?
+4. Overall assessment: Does this adequately answer the user's question?
+
+When a PREVIOUS VALIDATION HISTORY section is provided:
+1. Carefully read the previous validation assessments.
+2. Identify what information was MISSING or identified as needing improvement.
+3. Check if the current research findings address those missing elements.
+4. If gaps are now covered, you MUST increase the confidence score (typically 5-15 points
+   higher than the previous score).
+5. IMPROVEMENT CHECK (CRITICAL): explicitly state in your assessment which previously missing
+   information is now included, how much this improves the answer quality, and adjust the
+   score accordingly."""
 
 
 def get_validation_user_prompt(
@@ -47,19 +75,24 @@ def get_validation_user_prompt(
         query: User's original question
         research_result: Research findings to validate
         conversation_history: Previous messages in the conversation (optional)
-        previous_validations: Previous validation results for improvement tracking
+        previous_validations: Recent validation results for improvement tracking (last 2)
 
     Returns:
         User prompt for validation
     """
     prompt_parts = []
 
-    # Include summary if present (system messages with summaries)
-    summary_messages = [
-        msg
-        for msg in (conversation_history or [])
-        if msg.role == "system" and "summary" in msg.content.lower()
-    ]
+    # Split history in one pass: summary messages vs. the last 6 user/agent messages.
+    # Summaries can sit anywhere in the history, so the scan cannot stop early.
+    summary_messages = []
+    recent_messages: deque[Message] = deque(maxlen=6)
+    for msg in conversation_history or []:
+        if msg.is_summary:
+            summary_messages.append(msg)
+        elif msg.role in ("user", "agent"):
+            recent_messages.append(msg)
+
+    # Include summary if present
     if summary_messages:
         prompt_parts.append("Previous conversation summary:")
         for summary_msg in summary_messages:
@@ -68,88 +101,41 @@ def get_validation_user_prompt(
 
     # Include previous validation results for improvement tracking
     if previous_validations:
-        prompt_parts.append("=" * 80)
-        prompt_parts.append("PREVIOUS VALIDATION HISTORY - CRITICAL FOR SCORE IMPROVEMENT")
-        prompt_parts.append("=" * 80)
-        for i, val in enumerate(previous_validations[-2:], 1):  # Last 2 validations
+        prompt_parts.extend(_HISTORY_HEADER)
+        for i, val in enumerate(previous_validations, 1):
             score = val.get("confidence_score", "N/A")
             assessment = val.get("assessment", "")
-            prompt_parts.append(f"\nPrevious Validation {i}:")
-            prompt_parts.append(f"  Score: {score}%")
-            prompt_parts.append(f"  Assessment: {assessment}")
-            prompt_parts.append("")
-        prompt_parts.append("IMPORTANT INSTRUCTIONS:")
-        prompt_parts.append("1. Carefully read the previous validation assessments above.")
-        prompt_parts.append(
-            "2. Identify what information was MISSING or identified as needing improvement."
-        )
-        prompt_parts.append(
-            "3. Check if the current research findings address those missing elements."
-        )
-        prompt_parts.append(
-            "4. If gaps are now covered, you MUST increase the confidence score "
-            "(typically 5-15 points higher than the previous score)."
-        )
-        prompt_parts.append(
-            "5. Explicitly state in your assessment which previously missing information "
-            "is now included and how this improves the answer quality."
-        )
-        prompt_parts.append("=" * 80)
-        prompt_parts.append("")
+            prompt_parts.extend(
+                (
+                    f"\nPrevious Validation {i}:",
+                    f"  Score: {score}%",
+                    f"  Assessment: {assessment}",
+                    "",
+                )
+            )
+        prompt_parts.extend((_SEPARATOR, ""))
 
     # Include recent conversation context (last 3-4 messages, excluding summary)
-    if conversation_history and len(conversation_history) > 2:
-        # Filter out summary messages, keep only user/agent messages
-        recent_messages = [
-            msg
-            for msg in conversation_history
-            if msg.role in ("user", "agent") and "summary" not in msg.content.lower()
-        ]
-        if recent_messages:
-            # Get last 4-6 messages (2-3 exchanges)
-            if len(recent_messages) > 6:
-                messages_to_include = recent_messages[-6:-1]
-            else:
-                messages_to_include = recent_messages[:-1]
-            if messages_to_include:
-                prompt_parts.append("Recent conversation context:")
-                for msg in messages_to_include:
-                    role_label = "User" if msg.role == "user" else "Assistant"
-                    content = msg.content[:300] + "..." if len(msg.content) > 300 else msg.content
-                    prompt_parts.append(f"  {role_label}: {content}")
-                prompt_parts.append("")
-
-    prompt_parts.append(f"Current User Question: {query}")
-    prompt_parts.append("")
-    prompt_parts.append("Research Findings:")
-    prompt_parts.append(research_result)
-    prompt_parts.append("")
-    prompt_parts.append("Please validate these research findings. Address:")
-    prompt_parts.append("1. Is the information accurate and relevant to the question?")
-    prompt_parts.append("2. Are there any factual errors or inconsistencies?")
-    prompt_parts.append("3. Is any critical information missing?")
-    prompt_parts.append("4. Overall assessment: Does this adequately answer the user's question?")
-    if previous_validations:
-        prompt_parts.append("")
-        prompt_parts.append(
-            "5. IMPROVEMENT CHECK (CRITICAL): Compare this research with previous "
-            "validation assessments:"
-        )
-        prompt_parts.append(
-            "   a. What specific information was missing or identified as needing "
-            "improvement in the previous validation(s)?"
-        )
-        prompt_parts.append(
-            "   b. Does the current research findings include that missing information?"
-        )
-        prompt_parts.append(
-            "   c. If yes, how much does this improve the answer quality? "
-            "(This should result in a higher confidence score)"
-        )
-        prompt_parts.append(
-            "   d. Explicitly state the improvement in your assessment and adjust "
-            "the score accordingly."
+    if conversation_history and len(conversation_history) > 2 and recent_messages:
+        # Up to 5 messages (2-3 exchanges), excluding the newest one
+        messages_to_include = list(recent_messages)[:-1]
+        if messages_to_include:
+            prompt_parts.append("Recent conversation context:")
+            for msg in messages_to_include:
+                role_label = "User" if msg.role == "user" else "Assistant"
+                prompt_parts.append(f"  {role_label}: {clip_text(msg.content)}")
+            prompt_parts.append("")
+
+    prompt_parts.extend(
+        (
+            f"Current User Question: {query}",
+            "",
+            "Research Findings:",
+            research_result,
+            "",
+            "Please validate these research findings.",
         )
+    )
 
     return "\n".join(prompt_parts)
 
@@ -186,21 +172,18 @@ def get_validator_audio_summary_user_prompt(
     Returns:
         User prompt for validator audio summary generation
     """
-    prompt_parts = [f'You just validated research about: "{query}"', ""]
-
-    if conversation_history and len(conversation_history) > 2:
-        prompt_parts.append("This is part of an ongoing conversation.")
-        prompt_parts.append("")
+    ongoing = (
+        "This is part of an ongoing conversation.\n\n"
+        if conversation_history and len(conversation_history) > 2
+        else ""
+    )
 
-    prompt_parts.append(f"Your confidence score: {confidence_score}/100")
-    prompt_parts.append("")
-    prompt_parts.append("Your detailed validation:")
-    prompt_parts.append(validation_result)
-    prompt_parts.append("")
-    prompt_parts.append(
+    return (
+        f'You just validated research about: "{query}"\n\n'
+        f"{ongoing}"
+        f"Your confidence score: {confidence_score}/100\n\n"
+        f"Your detailed validation:\n{validation_result}\n\n"
         "Now, verbally share your validation assessment in a natural, conversational way "
         "(2-3 sentences). Include your confidence level naturally in the conversation. "
         "If this continues a previous topic, reference it naturally."
     )
-
-    return "\n".join(prompt_parts)
@@ -1,9 +1,52 @@
 """Utility functions for checkpoint management and thread ID handling."""
 
+import asyncio
 import re
 import sqlite3
+import string
+from contextlib import closing
 from pathlib import Path
 
+import aiosqlite
+
+# Connection-level tuning for the checkpoint database. journal_mode is persisted in the
+# file, the rest applies per connection and must be set each time the database is opened.
+CHECKPOINT_DB_PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA cache_size=-64000;
+PRAGMA temp_store=MEMORY;
+PRAGMA mmap_size=268435456;
+PRAGMA wal_autocheckpoint=10000;
+"""
+
+# Characters dropped from normalized user and topic names
+_DISALLOWED_ID_CHARS = re.compile(r"[^a-z0-9_-]")
+
+# ASCII fast path for the same filter: spaces become hyphens and anything else outside
+# [a-z0-9_-] is deleted in one bytes.translate pass
+_ID_SPACE_TO_HYPHEN = bytes.maketrans(b" ", b"-")
+_ID_DELETE_BYTES = bytes(
+    code for code in range(128) if chr(code) not in string.ascii_lowercase + string.digits + "_- "
+)
+
+
+def _clean_id_part(value: str) -> str:
+    """Lowercase, trim and filter one part of a thread_id.
+
+    Args:
+        value: User or topic name
+
+    Returns:
+        Value with spaces replaced by hyphens and only [a-z0-9_-] kept
+    """
+    value = value.lower().strip()
+    if value.isascii():
+        return (
+            value.encode("ascii").translate(_ID_SPACE_TO_HYPHEN, _ID_DELETE_BYTES).decode("ascii")
+        )
+    return _DISALLOWED_ID_CHARS.sub("", value.replace(" ", "-"))
+
 
 def normalize_thread_id(user: str, topic: str) -> str:
     """Generate normalized thread_id from user and topic.
@@ -16,12 +59,12 @@ def normalize_thread_id(user: str, topic: str) -> str:
         Normalized thread_id in format: {user}:{topic}
     """
     # Normalize user: lowercase, trim, replace spaces with hyphens
-    normalized_user = re.sub(r"[^a-z0-9_-]", "", user.lower().strip().replace(" ", "-"))
+    normalized_user = _clean_id_part(user)
     if not normalized_user:
         normalized_user = "default-user"
 
     # Normalize topic: lowercase, trim, replace spaces with hyphens, limit length
-    normalized_topic = re.sub(r"[^a-z0-9_-]", "", topic.lower().strip().replace(" ", "-"))[:50]
+    normalized_topic = _clean_id_part(topic)[:50]
     if not normalized_topic:
         normalized_topic = "general"
 
@@ -48,8 +91,17 @@ def parse_thread_id(thread_id: str) -> tuple[str, str] | None:
     return (user, topic)
 
 
-async def list_all_thread_ids(db_path: str | Path) -> list[str]:
-    """List all thread_ids from the checkpoint database.
+async def configure_checkpoint_connection(conn: aiosqlite.Connection) -> None:
+    """Apply write-friendly PRAGMAs to an open checkpoint database connection.
+
+    Args:
+        conn: Async SQLite connection used by the checkpointer
+    """
+    await conn.executescript(CHECKPOINT_DB_PRAGMAS)
+
+
+def fetch_thread_ids(db_path: str | Path) -> list[str]:
+    """Read all thread_ids from the checkpoint database (blocking).
 
     Args:
         db_path: Path to SQLite checkpoint database
@@ -62,19 +114,30 @@ async def list_all_thread_ids(db_path: str | Path) -> list[str]:
         return []
 
     try:
-        conn = sqlite3.connect(str(db_path))
-        cursor = conn.cursor()
-
-        # LangGraph stores checkpoints in 'checkpoints' table with 'thread_id' column
-        cursor.execute("SELECT DISTINCT thread_id FROM checkpoints ORDER BY thread_id")
-        thread_ids = [row[0] for row in cursor.fetchall()]
-
-        conn.close()
-        return thread_ids
+        # Read-only, so listing never contends with the checkpointer's writes
+        with closing(sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)) as conn:
+            # LangGraph stores checkpoints in 'checkpoints' table with 'thread_id' column.
+            # Its primary key starts with thread_id, so this is a covering index scan.
+            rows = conn.execute(
+                "SELECT DISTINCT thread_id FROM checkpoints ORDER BY thread_id"
+            ).fetchall()
+        return [row[0] for row in rows]
     except sqlite3.Error:
         return []
 
 
+async def list_all_thread_ids(db_path: str | Path) -> list[str]:
+    """List all thread_ids from the checkpoint database without blocking the event loop.
+
+    Args:
+        db_path: Path to SQLite checkpoint database
+
+    Returns:
+        List of thread_ids
+    """
+    return await asyncio.to_thread(fetch_thread_ids, db_path)
+
+
 def list_users(thread_ids: list[str]) -> list[str]:
     """Extract unique user names from thread_ids.
 
@@ -8,6 +8,7 @@ from langgraph_audio_agents.utils.conversation_manager import (
     should_summarize,
 )
 from langgraph_audio_agents.utils.conversation_summarizer import (
+    SUMMARY_PREFIX,
     summarize_conversation,
 )
 
@@ -42,9 +43,7 @@ async def manage_conversation_context(
 
     # Create summary
     summary_text = await summarize_conversation(messages_to_summarize, llm_client)
-    summary_message = Message(
-        role="system", content=f"Previous conversation summary: {summary_text}"
-    )
+    summary_message = Message(role="summary", content=f"{SUMMARY_PREFIX}{summary_text}")
 
     # Combine: summary + recent messages
     return [summary_message] + recent_messages
@@ -1,5 +1,6 @@
 """Conversation context management and summarization utilities."""
 
+from functools import lru_cache
 from typing import Any
 
 import tiktoken
@@ -7,6 +8,23 @@ import tiktoken
 from langgraph_audio_agents.domain.value_objects.message import Message
 
 
+@lru_cache(maxsize=8)
+def _get_encoding(model: str) -> tiktoken.Encoding:
+    """Return the tiktoken encoding for a model, resolved once per model.
+
+    Args:
+        model: Model name for tokenizer
+
+    Returns:
+        Encoding for the model, or cl100k_base if the model is unknown
+    """
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        # Fallback to cl100k_base encoding if model not found
+        return tiktoken.get_encoding("cl100k_base")
+
+
 def count_tokens(text: str, model: str = "gpt-4o") -> int:
     """Count tokens in text using tiktoken.
 
@@ -17,13 +35,7 @@ def count_tokens(text: str, model: str = "gpt-4o") -> int:
     Returns:
         Number of tokens
     """
-    try:
-        encoding = tiktoken.encoding_for_model(model)
-        return len(encoding.encode(text))
-    except KeyError:
-        # Fallback to cl100k_base encoding if model not found
-        encoding = tiktoken.get_encoding("cl100k_base")
-        return len(encoding.encode(text))
+    return len(_get_encoding(model).encode(text))
 
 
 def estimate_message_tokens(messages: list[Message]) -> int:
@@ -68,19 +80,22 @@ def extract_validation_results_from_metadata(
     Returns:
         List of validation result dicts with keys: confidence_score, assessment, is_validated
     """
+    # Only the last 2 validation results (most recent) are kept, so scan from the end
     validations = []
-    for meta in metadata_history:
-        if "confidence_score" in meta and "agent" in meta and meta.get("agent") == "validator":
+    for meta in reversed(metadata_history):
+        if meta.get("agent") == "validator" and "confidence_score" in meta:
             validations.append(
                 {
-                    "confidence_score": meta.get("confidence_score"),
+                    "confidence_score": meta["confidence_score"],
                     "assessment": meta.get("assessment", ""),
                     "is_validated": meta.get("is_validated", False),
                 }
             )
+            if len(validations) == 2:
+                break
 
-    # Return last 2 validation results (most recent)
-    return validations[-2:] if len(validations) >= 2 else validations
+    validations.reverse()
+    return validations
 
 
 def should_summarize(
@@ -105,11 +120,42 @@ def should_summarize(
     if exchanges > max_exchanges:
         return True
 
+    # Every BPE token covers at least one UTF-8 byte, so a history whose encoded size fits
+    # the budget cannot exceed it in tokens. Characters per token vary too much (CJK, emoji,
+    # code) for any tighter estimate to be safe, so everything else is tokenized.
+    byte_count = sum(len(msg.role.encode()) + len(msg.content.encode()) + 2 for msg in messages)
+    if byte_count <= max_tokens:
+        return False
+
     # Check token count
     token_count = estimate_message_tokens(messages)
     return token_count > max_tokens
 
 
+def _find_start_index(messages: list[Message], num_exchanges: int) -> int | None:
+    """Find where the most recent N exchanges begin.
+
+    Scans backwards and stops at the Nth user message, so only the tail is visited.
+
+    Args:
+        messages: List of all messages
+        num_exchanges: Number of recent exchanges to keep
+
+    Returns:
+        Index of the first message to keep, or None if there are no more than N exchanges
+    """
+    remaining = num_exchanges
+    for index in range(len(messages) - 1, -1, -1):
+        if messages[index].role == "user":
+            remaining -= 1
+            if remaining == 0:
+                # The Nth user message from the end only starts the window if an older
+                # exchange exists before it (usually found at the very first message)
+                has_older = any(messages[i].role == "user" for i in range(index))
+                return index if has_older else None
+    return None
+
+
 def get_recent_exchanges(messages: list[Message], num_exchanges: int = 5) -> list[Message]:
     """Get the most recent N exchanges from messages.
 
@@ -122,15 +168,10 @@ def get_recent_exchanges(messages: list[Message], num_exchanges: int = 5) -> lis
     Returns:
         List of messages from recent exchanges
     """
-    # Count user messages to find exchanges
-    user_indices = [i for i, msg in enumerate(messages) if msg.role == "user"]
-
-    if len(user_indices) <= num_exchanges:
+    start_index = _find_start_index(messages, num_exchanges)
+    if start_index is None:
         # Not enough exchanges, return all
         return messages
-
-    # Get the starting index for the last N exchanges
-    start_index = user_indices[-num_exchanges]
     return messages[start_index:]
 
 
@@ -144,13 +185,8 @@ def get_messages_to_summarize(messages: list[Message], num_exchanges: int = 5) -
     Returns:
         List of messages to summarize
     """
-    # Count user messages to find exchanges
-    user_indices = [i for i, msg in enumerate(messages) if msg.role == "user"]
-
-    if len(user_indices) <= num_exchanges:
+    start_index = _find_start_index(messages, num_exchanges)
+    if start_index is None:
         # Not enough exchanges, nothing to summarize
         return []
-
-    # Get everything before the last N exchanges
-    start_index = user_indices[-num_exchanges]
     return messages[:start_index]
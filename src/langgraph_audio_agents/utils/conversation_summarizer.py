@@ -3,6 +3,9 @@
 from langgraph_audio_agents.domain.value_objects.message import Message
 from langgraph_audio_agents.infrastructure.llm.openai_client import OpenAIClient
 
+# Prefix used for summary messages stored in the conversation history
+SUMMARY_PREFIX = "Previous conversation summary: "
+
 
 async def summarize_conversation(
     messages: list[Message],
@@ -10,6 +13,9 @@ async def summarize_conversation(
 ) -> str:
     """Summarize a conversation history.
 
+    If the messages start from an earlier summary, only the turns after the newest
+    summary are sent, together with that summary, so the prompt stays bounded.
+
     Args:
         messages: Messages to summarize
         llm_client: LLM client for summarization
@@ -20,9 +26,20 @@ async def summarize_conversation(
     if not messages:
         return ""
 
+    # Find the newest summary; everything before it is already covered by it
+    prior_summary = ""
+    for index in range(len(messages) - 1, -1, -1):
+        if messages[index].is_summary:
+            prior_summary = messages[index].content.removeprefix(SUMMARY_PREFIX)
+            messages = messages[index + 1 :]
+            break
+
+    if not messages:
+        return prior_summary
+
     # Format messages for summarization
     conversation_text = "\n\n".join(
-        [f"{'User' if msg.role == 'user' else 'Assistant'}: {msg.content}" for msg in messages]
+        f"{'User' if msg.role == 'user' else 'Assistant'}: {msg.content}" for msg in messages
     )
 
     system_prompt = """You are a conversation summarizer. Your job is to create a concise
@@ -35,14 +52,23 @@ Keep the summary brief (200-300 tokens). Focus on high-level topics and findings
 specific validation scores or detailed assessments. This summary will be used to provide
 context for future exchanges."""
 
-    user_prompt = f"""Please summarize this conversation:
+    if prior_summary:
+        user_prompt = f"""Update the following summary with the new turns.
+
+Existing summary:
+{prior_summary}
+
+New turns:
+{conversation_text}
+
+Provide a single concise summary covering both, focusing on topics discussed and key findings."""
+    else:
+        user_prompt = f"""Please summarize this conversation:
 
 {conversation_text}
 
 Provide a concise summary focusing on topics discussed and key findings."""
 
-    summary = await llm_client.create_response(
-        input=f"{system_prompt}\n\n{user_prompt}",
-    )
+    summary = await llm_client.create_response(system_prompt, user_prompt)
 
     return summary.strip()
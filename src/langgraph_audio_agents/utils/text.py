@@ -0,0 +1,16 @@
+"""Small text helpers shared by prompts and console output."""
+
+
+def clip_text(text: str, max_length: int = 300) -> str:
+    """Truncate text to a maximum length, marking the cut with an ellipsis.
+
+    Args:
+        text: Text to truncate
+        max_length: Maximum number of characters kept (default: 300)
+
+    Returns:
+        The original text if it fits, otherwise its first max_length characters plus "..."
+    """
+    if len(text) <= max_length:
+        return text
+    return f"{text[:max_length]}..."